@@ -1,2 +1,2 @@
-from .autograd_quantiser import _PACTQuantiser
+from .autograd_quantiser import _PACTQuantiser, _pact_fake_quantise
 from .autograd_redirectcliphi import _PACTRedirectClipHiGrad
@@ -2,6 +2,47 @@ import torch
 from typing import Tuple
 
 
+def _pact_fake_quantise(x:       torch.Tensor,
+                        clip_lo: torch.Tensor,
+                        clip_hi: torch.Tensor,
+                        step:    torch.Tensor,
+                        scale:   torch.Tensor,
+                        round:   bool = False) -> torch.Tensor:
+    """Compute the fake-quantised version of ``x``.
+
+    This function computes the forward pass of ``_PACTQuantiser`` without
+    computing the masks that are required by the backward pass. Therefore,
+    it can be called directly when autograd is not recording operations
+    (e.g., during inference).
+
+    """
+
+    # The following operations are applied in-place to the intermediate
+    # arrays, so that we do not allocate a new array with the size of `x`
+    # for each elementary operation. Note that in-place modifications are
+    # safe here, since the first operation (`torch.clamp`) already returns a
+    # new array, and this function is either called inside `forward` (which
+    # is not recorded by autograd) or while autograd is disabled.
+
+    # rescale by the quantum to prepare for integerisation
+    # `eps / 4` is arbitrary: any value between zero and `eps / 2` can
+    # guarantee proper saturation both with the flooring and the rounding
+    # operations.
+    # Clipping to `[clip_lo, clip_hi + eps / 4]` and then subtracting
+    # `clip_lo` is equivalent to clipping `x - clip_lo` to `[0, clip_hi +
+    # eps / 4 - clip_lo]`, but does not require creating a zero-valued
+    # `torch.Tensor` on the device of the input at each call.
+    x_scaled_and_clipped = torch.clamp(x, clip_lo, clip_hi + (scale / 4)).sub_(clip_lo).div_(step * scale)
+
+    # integerise (fused binning and re-mapping)
+    x_int = x_scaled_and_clipped.add_(0.5).floor_() if round else x_scaled_and_clipped.floor_()
+
+    # fake-quantise
+    x_fq = x_int.mul_(scale).add_(clip_lo)
+
+    return x_fq
+
+
 class _PACTQuantiser(torch.autograd.Function):
     r"""PACT (PArametrized Clipping acTivation) quantisation function.
 
@@ -67,24 +108,16 @@ class _PACTQuantiser(torch.autograd.Function):
 
         # partition the components of the input tensor with respect to the clipping bounds
         where_x_lo = (x < clip_lo)
-        where_x_nc = (clip_lo <= x) * (x < clip_hi)  # non-clipped
         where_x_hi = (clip_hi <= x)
+        where_x_nc = (clip_lo <= x) & (x < clip_hi)  # non-clipped (we do not negate the other masks, so that NaNs do not receive the pass-through gradient)
         # assert torch.all((where_x_lo + where_x_nc + where_x_hi) == 1.0)
 
-        # rescale by the quantum to prepare for integerisation
-        # `eps / 4` is arbitrary: any value between zero and `eps / 2` can
-        # guarantee proper saturation both with the flooring and the rounding
-        # operations.
-        x_scaled_and_clipped = torch.clamp(x - clip_lo, torch.tensor(0.0).to(device=clip_lo.device), clip_hi + (scale / 4) - clip_lo) / (step * scale)  # TODO: is `clip_lo` a reasonably reliable reference to move a newly-generated tensor to a specific device?
-
-        # integerise (fused binning and re-mapping)
-        x_int = (x_scaled_and_clipped + 0.5).floor() if round else x_scaled_and_clipped.floor()
-
         # fake-quantise
-        x_fq = clip_lo + scale * x_int
+        x_fq = _pact_fake_quantise(x, clip_lo, clip_hi, step, scale, round=round)
 
-        # pack context
-        ctx.save_for_backward(where_x_lo, where_x_nc, where_x_hi, clip_lo, clip_hi, torch.tensor(clip_g))
+        # pack context (`clip_g` is a Python flag, so we store it as an attribute instead of wrapping it into a new `torch.Tensor` at each call)
+        ctx.save_for_backward(where_x_lo, where_x_nc, where_x_hi, clip_lo, clip_hi)
+        ctx.clip_g = clip_g
 
         return x_fq
 
@@ -93,10 +126,11 @@ class _PACTQuantiser(torch.autograd.Function):
         """Compute the backward pass of the PACT operation."""
 
         # unpack context
-        where_x_lo, where_x_nc, where_x_hi, clip_lo, clip_hi, clip_g = ctx.saved_tensors
+        where_x_lo, where_x_nc, where_x_hi, clip_lo, clip_hi = ctx.saved_tensors
+        clip_g = ctx.clip_g
 
         # I define this constant once to avoid recreating and casting a `torch.Tensor` at each place where it's needed
-        zero = torch.zeros(1).to(where_x_nc.device)
+        zero = g_in.new_zeros(1)  # allocate directly on the device (and with the data type) of the gradient, without a host-to-device copy
 
         # clip the gradient that goes towards the input?
         # See "Quantized neural networks: training neural networks with low
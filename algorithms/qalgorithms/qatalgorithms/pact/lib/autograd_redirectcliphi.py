@@ -9,8 +9,9 @@ class _PACTRedirectClipHiGrad(torch.autograd.Function):
     @staticmethod
     def forward(ctx, clip_lo: torch.Tensor, n_levels: torch.Tensor, step: torch.Tensor) -> torch.Tensor:
 
-        multiplier = -(n_levels - 2) / n_levels
-        multiplier[(n_levels % 2 != 0) | (step != IMPLICIT_STEP)] = -1.0
+        # `torch.where` (as opposed to a masked assignment) does not need to synchronise with the device to compute the selection
+        where_symmetric = (n_levels % 2 != 0) | (step != IMPLICIT_STEP)
+        multiplier = torch.where(where_symmetric, torch.full_like(n_levels, -1.0), -(n_levels - 2) / n_levels)
 
         ctx.save_for_backward(multiplier)
 
@@ -43,7 +43,8 @@ class PACTOptimiserFactory(object):  # https://stackoverflow.com/questions/21060
 
             # split PACT-learnable parameters from the remaining ones
             pact_learnable_clipping_params = [p for m in pact_modules for p in (m.clip_lo, m.clip_hi) if p.requires_grad]
-            other_params = [p_ for p_ in network.parameters() if not any(p_ is p for p in pact_learnable_clipping_params)]
+            pact_learnable_clipping_params_ids = set(map(id, pact_learnable_clipping_params))  # membership by identity, without scanning the list for each parameter
+            other_params = [p_ for p_ in network.parameters() if id(p_) not in pact_learnable_clipping_params_ids]
 
             # Note: when the learnable clipping parameters are not used
             # (e.g., while quantization is disabled), the weight decay
@@ -3,7 +3,7 @@ import torch
 import torch.nn as nn
 from typing import Tuple, Union
 
-from .lib import _PACTQuantiser, _PACTRedirectClipHiGrad
+from .lib import _PACTQuantiser, _pact_fake_quantise, _PACTRedirectClipHiGrad
 from quantlib.algorithms.qbase import get_scale, get_zero_scale
 from quantlib.utils import quantlib_err_header
 
@@ -22,7 +22,16 @@ class _PACTModule(nn.Module):
         self._get_learnable_clipping_bounds()
 
         self.register_buffer('_clipping_bounds_are_frozen', torch.tensor(False))
+        self._sync_frozen_flag()
         self._flag_bounds_as_learnable()
+
+    def _sync_frozen_flag(self):
+        # see `_QModule._sync_flags`
+        self._clipping_bounds_are_frozen_flag: bool = bool(self._clipping_bounds_are_frozen)
+
+    def _load_from_state_dict(self, *args, **kwargs):
+        super(_PACTModule, self)._load_from_state_dict(*args, **kwargs)
+        self._sync_frozen_flag()
     
     def _check_clipping_bounds(self, a: torch.Tensor, b: torch.Tensor):
         if not torch.all(a < b):
@@ -43,34 +52,6 @@ class _PACTModule(nn.Module):
 
         self._pact_learnable_bounds = pact_learnable_bounds
 
-    def _flag_bounds_as_learnable(self):
-        raise NotImplementedError
-
-    def _update_qhparams_and_clipping_bounds(self):
-        raise NotImplementedError
-
-    def freeze(self):
-        self._update_qhparams_and_clipping_bounds()
-        self.clip_lo.requires_grad = False
-        self.clip_hi.requires_grad = False
-        self._clipping_bounds_are_frozen |= True
-
-    def thaw(self):
-        self._flag_bounds_as_learnable()
-        self._clipping_bounds_are_frozen &= False
-
-    def register_qop(self):
-        self._qop = _PACTQuantiser.apply
-
-    def call_qop(self, x: torch.Tensor) -> torch.Tensor:
-        raise NotImplementedError
-
-
-class _PACTActivation(_PACTModule):
-
-    def __init__(self):
-        _PACTModule.__init__(self)
-
     def _flag_bounds_as_learnable(self):
 
         if self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO:
@@ -87,7 +68,7 @@ class _PACTActivation(_PACTModule):
 
     def _update_qhparams_and_clipping_bounds(self):
 
-        if self._clipping_bounds_are_frozen:
+        if self._clipping_bounds_are_frozen_flag:
             pass
 
         else:
@@ -124,79 +105,70 @@ class _PACTActivation(_PACTModule):
 
                 self._set_clipping_bounds()
 
-    def _maybe_redirect_clip_hi_grad(self) -> Tuple[torch.Tensor, torch.Tensor]:
+    def freeze(self):
+        self._update_qhparams_and_clipping_bounds()
+        self.clip_lo.requires_grad = False
+        self.clip_hi.requires_grad = False
+        self._clipping_bounds_are_frozen |= True
+        self._sync_frozen_flag()
 
-        if self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO:
-            clip_hi = _PACTRedirectClipHiGrad.apply(self.clip_lo, self.n_levels, self.step)
-        else:
-            clip_hi = self.clip_hi
+    def thaw(self):
+        self._flag_bounds_as_learnable()
+        self._clipping_bounds_are_frozen &= False
+        self._sync_frozen_flag()
 
-        return self.clip_lo, clip_hi
+    def register_qop(self):
+        self._qop = _PACTQuantiser.apply
+
+    def _get_qop(self):
+        # when autograd is not recording (e.g., during inference), we can skip
+        # the `torch.autograd.Function` and the masks it computes for the STE
+        return self._qop if torch.is_grad_enabled() else _pact_fake_quantise
 
     def call_qop(self, x: torch.Tensor) -> torch.Tensor:
-        self._update_qhparams_and_clipping_bounds()
-        clip_lo, clip_hi = self._maybe_redirect_clip_hi_grad()
-        x = self._qop(x, clip_lo, clip_hi, self.step, self.scale)
-        return x
+        raise NotImplementedError
 
 
-class _PACTLinear(_PACTModule):
+class _PACTActivation(_PACTModule):
 
     def __init__(self):
         _PACTModule.__init__(self)
 
-    def _flag_bounds_as_learnable(self):
+        # the learnable clipping bounds are fixed at construction time, so we resolve once how to compute the upper clipping bound (instead of at each forward pass)
         if self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO:
-            assert self._pin_offset
-            self.clip_lo.requires_grad = True
-
-        elif self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_HI:
-            assert self._pin_offset
-            self.clip_hi.requires_grad = True
+            self._get_clip_hi = self._get_redirected_clip_hi
+        else:
+            self._get_clip_hi = self._get_learnt_clip_hi
 
-        else:  # self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO_AND_CLIP_HI
-            self.clip_lo.requires_grad = True
-            self.clip_hi.requires_grad = True
+    def _get_redirected_clip_hi(self) -> torch.Tensor:
+        # `clip_hi` is kept consistent with `clip_lo` by `_update_qhparams_and_clipping_bounds`;
+        # we only need to derive it from `clip_lo` when there is a gradient to redirect (i.e.,
+        # not when the bounds are frozen or during inference)
+        if torch.is_grad_enabled() and self.clip_lo.requires_grad:
+            clip_hi = _PACTRedirectClipHiGrad.apply(self.clip_lo, self.n_levels, self.step)
+        else:
+            clip_hi = self.clip_hi
+        return clip_hi
 
-    def _update_qhparams_and_clipping_bounds(self):
+    def _get_learnt_clip_hi(self) -> torch.Tensor:
+        return self.clip_hi
 
-        if self._clipping_bounds_are_frozen:
-            pass
-        else:
-            with torch.no_grad():
+    def _maybe_redirect_clip_hi_grad(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        return self.clip_lo, self._get_clip_hi()
 
-                if self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO:
-                    assert self._pin_offset
-                    a = self.clip_lo.data
-                    b = -a
-                    self._check_clipping_bounds(a, b)
-                    scale = get_scale(a, b, self.zero, self.n_levels, self.step)
-                    self.scale.data.copy_(scale)
+    def call_qop(self, x: torch.Tensor) -> torch.Tensor:
+        self._update_qhparams_and_clipping_bounds()
+        clip_lo, clip_hi = self._maybe_redirect_clip_hi_grad()
+        x = self._get_qop()(x, clip_lo, clip_hi, self.step, self.scale)
+        return x
 
-                elif self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_HI:
-                    assert self._pin_offset
-                    a = self.clip_lo.data
-                    b = self.clip_hi.data
-                    assert torch.all(a == 0.0)
-                    self._check_clipping_bounds(a, b)
-                    scale = get_scale(a, b, self.zero, self.n_levels, self.step)
-                    self.scale.data.copy_(scale)
 
-                else:  # self._pact_learnable_bounds == PACTLearnableClippingBounds.CLIP_LO_AND_CLIP_HI
-                    a = self.clip_lo.data
-                    b = self.clip_hi.data
-                    self._check_clipping_bounds(a, b)
-                    if self._pin_offset:
-                        scale = get_scale(a, b, self.zero, self.n_levels, self.step)
-                        self.scale.data.copy_(scale)
-                    else:
-                        zero, scale = get_zero_scale(a, b, self.n_levels, self.step)
-                        self.zero.data.copy_(zero)
-                        self.scale.data.copy_(scale)
+class _PACTLinear(_PACTModule):
 
-                self._set_clipping_bounds()
+    def __init__(self):
+        _PACTModule.__init__(self)
 
     def call_qop(self, x: torch.Tensor) -> torch.Tensor:
         self._update_qhparams_and_clipping_bounds()
-        x = self._qop(x, self.clip_lo, self.clip_hi, self.step, self.scale)
+        x = self._get_qop()(x, self.clip_lo, self.clip_hi, self.step, self.scale)
         return x
@@ -1,4 +1,5 @@
 import unittest
+import copy
 import torch
 import torch.nn as nn
 
@@ -263,3 +264,96 @@ class PACTModulesTest(unittest.TestCase):
         clip_hi_new = pactc2d.clip_hi.data
         self.assertFalse(torch.all(clip_lo_new == clip_lo_old))
         self.assertFalse(torch.all(clip_hi_new == clip_hi_old))
+
+    def test__pactinference(self):
+
+        # create object
+        qrangespec = {'bitwidth': 4, 'signed': False}
+        qgranularityspec = 'per-array'
+        qhparamsinitstrategyspec = ('const', {'a': 0.0, 'b': 2.0})
+        pactrelu = PACTReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        pactrelu.init_qhparams()
+        # does the autograd-free path yield the same fake-quantised array?
+        x = torch.randn(_FEATURES_SHAPE)
+        fqy = pactrelu(x)
+        with torch.no_grad():
+            fqy_nograd = pactrelu(x)
+        self.assertTrue(torch.all(fqy.detach() == fqy_nograd))
+        self.assertFalse(fqy_nograd.requires_grad)
+
+        # clip_lo-only (`clip_hi` is redirected from `clip_lo` only when autograd is recording)
+        # create object
+        qrangespec = {'bitwidth': 4, 'signed': True}
+        qgranularityspec = 'per-array'
+        qhparamsinitstrategyspec = ('const', {'a': -2.0, 'b': 2.0})
+        pactrelu = PACTReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        self.assertTrue(pactrelu.clip_lo.requires_grad)
+        pactrelu.init_qhparams()
+        # does the autograd-free path yield the same fake-quantised array?
+        # (thawed quasi-symmetric bounds are updated at each forward pass, so we restore them before the second one)
+        x = torch.randn(_FEATURES_SHAPE)
+        state_dict = copy.deepcopy(pactrelu.state_dict())
+        fqy = pactrelu(x)
+        pactrelu.load_state_dict(state_dict)
+        with torch.no_grad():
+            fqy_nograd = pactrelu(x)
+        self.assertTrue(torch.all(fqy.detach() == fqy_nograd))
+        self.assertFalse(fqy_nograd.requires_grad)
+        # ...and after freezing the clipping bounds?
+        pactrelu.freeze()
+        fqy = pactrelu(x)
+        with torch.no_grad():
+            fqy_nograd = pactrelu(x)
+        self.assertTrue(torch.all(fqy.detach() == fqy_nograd))
+
+    def test__pactfrozenflagafterloadstatedict(self):
+
+        qrangespec = {'bitwidth': 4, 'signed': False}
+        qgranularityspec = 'per-array'
+        qhparamsinitstrategyspec = ('const', {'a': 0.0, 'b': 2.0})
+
+        # create source object and freeze its clipping bounds
+        src = PACTReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        src.init_qhparams()
+        src.freeze()
+        self.assertTrue(src._clipping_bounds_are_frozen_flag)
+        # load its state into a fresh object: does the Python-side mirror follow the buffer?
+        pactrelu = PACTReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        self.assertFalse(pactrelu._clipping_bounds_are_frozen_flag)
+        pactrelu.load_state_dict(src.state_dict())
+        self.assertTrue(pactrelu._clipping_bounds_are_frozen_flag)
+        self.assertTrue(pactrelu._is_quantised_flag)
+        x = torch.randn(_FEATURES_SHAPE)
+        self.assertTrue(torch.all(pactrelu(x) == src(x)))
+        # frozen clipping bounds: moving `clip_hi` must not update the quantiser
+        scale_old = pactrelu.scale.clone()
+        pactrelu.clip_hi.data *= 2.0
+        _ = pactrelu(x)
+        self.assertTrue(torch.all(pactrelu.scale == scale_old))
+        # thaw clipping bounds: moving `clip_hi` must update the quantiser again
+        pactrelu.thaw()
+        self.assertFalse(pactrelu._clipping_bounds_are_frozen_flag)
+        _ = pactrelu(x)
+        self.assertFalse(torch.all(pactrelu.scale == scale_old))
+
+        # does a thawed state override a frozen one?
+        src.load_state_dict(pactrelu.state_dict())
+        self.assertFalse(src._clipping_bounds_are_frozen_flag)
+
+    def test__pactnangradient(self):
+
+        # create object
+        qrangespec = {'bitwidth': 4, 'signed': False}
+        qgranularityspec = 'per-array'
+        qhparamsinitstrategyspec = ('const', {'a': 0.0, 'b': 2.0})
+        pactrelu = PACTReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        pactrelu.init_qhparams()
+        # NaN components are neither clipped nor non-clipped: they should not receive the pass-through gradient
+        x = torch.randn(_FEATURES_SHAPE)
+        x[0, 0, 0, 0] = float('nan')
+        x.requires_grad = True
+        fqy = pactrelu(x)
+        fqy.backward(_FEATURES_ONES)
+        self.assertTrue(x.grad[0, 0, 0, 0] == 0.0)
+        where_x_nc = (pactrelu.clip_lo <= x) & (x < pactrelu.clip_hi)
+        self.assertTrue(torch.all(x.grad[where_x_nc] == 1.0))
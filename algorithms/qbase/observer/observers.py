@@ -23,6 +23,16 @@ from quantlib.utils import quantlib_err_header
 # qrange sign (special)
 
 
+# `torch.aminmax` computes both extrema in a single sweep over the array, but
+# it is only available from PyTorch 1.11; on older versions, we reduce the
+# extrema separately
+if hasattr(torch, 'aminmax'):
+    _aminmax = torch.aminmax
+else:
+    def _aminmax(t: torch.Tensor, dim: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        return torch.amin(t, dim=dim), torch.amax(t, dim=dim)
+
+
 class TensorObserver(object):
 
     def __init__(self,
@@ -84,11 +94,18 @@ class TensorObserver(object):
     def _make_broadcastable(self, t: torch.Tensor) -> torch.Tensor:
         return t.reshape(self._broadcasting_shape)
 
+    def _split_subpopulations(self, t: torch.Tensor) -> torch.Tensor:
+        """Reshape an array so that each row contains the samples from one
+        sub-population."""
+        t = t.detach()  # statistics are accumulated in-place, which autograd does not support (e.g., when observing weights during QAT)
+        t = t.permute(self._permutation)
+        t = t.reshape(self._n_subpopulations, -1)
+        return t
+
     def update(self, t: torch.Tensor):
 
         self._check_t(t)
-        t = t.permute(self._permutation)
-        t = t.reshape(self._n_subpopulations, -1)
+        t = self._split_subpopulations(t)
 
         for s in self._statistics.values():
             s.update(t)
@@ -106,17 +123,37 @@ class MinMaxMeanVarObserver(TensorObserver):
             subpopulation_dims
         )
 
+    def update(self, t: torch.Tensor):
+
+        self._check_t(t)
+        t = self._split_subpopulations(t)
+
+        # the extrema are reduced jointly (see `_aminmax`), then the statistics only merge the reduced values
+        min_, max_ = _aminmax(t, dim=-1)
+        sum_       = torch.sum(t, dim=-1)
+        sum2       = torch.sum(t.pow(2), dim=-1)
+
+        self._statistics['n'].update(t)  # only depends on the shape of the array
+        self._statistics['min'].accumulate(min_)
+        self._statistics['max'].accumulate(max_)
+        self._statistics['sum'].accumulate(sum_)
+        self._statistics['sum2'].accumulate(sum2)
+
+    # The running values of the statistics are updated in-place, whereas
+    # reshaping might return a view of them; therefore, we return copies, so
+    # that the arrays read by clients are not modified by later updates.
+
     @property
     def n(self) -> torch.Tensor:
-        return self._make_broadcastable(self._statistics['n'].payload.values)
+        return self._make_broadcastable(self._statistics['n'].payload.values).clone()
 
     @property
     def min(self) -> torch.Tensor:
-        return self._make_broadcastable(self._statistics['min'].payload.values)
+        return self._make_broadcastable(self._statistics['min'].payload.values).clone()
 
     @property
     def max(self) -> torch.Tensor:
-        return self._make_broadcastable(self._statistics['max'].payload.values)
+        return self._make_broadcastable(self._statistics['max'].payload.values).clone()
 
     @property
     def mean(self) -> torch.Tensor:
@@ -39,25 +39,45 @@ class TensorStatistic(object):
     def is_tracking(self) -> bool:
         return self._payload is not None
 
+    def _check_n_subpopulations(self, n_subpopulations: int) -> None:
+        if self.is_tracking and (n_subpopulations != self._payload.n_subpopulations):
+            raise ValueError(quantlib_err_header(obj_name=self.__class__.__name__) + f"was tracking {self._payload.n_subpopulations} sub-populations, but received {n_subpopulations} samples.")
+
     def _check_t(self, t: torch.Tensor) -> None:
 
         if t.ndim != 2:
             raise ValueError(quantlib_err_header(obj_name=self.__class__.__name__) + f"expects two-dimensional arrays, but received an array of dimension {t.ndim}.")
 
-        if self.is_tracking:
-            n_subpopulations = t.shape[0]
-            if n_subpopulations != self._payload.n_subpopulations:
-                raise ValueError(quantlib_err_header(obj_name=self.__class__.__name__) + f"was tracking {self._payload.n_subpopulations} sub-populations, but received {n_subpopulations} samples.")
+        self._check_n_subpopulations(t.shape[0])
+
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        """Compute the value of the statistic on each sub-population."""
+        raise NotImplementedError
 
-    def _update(self, t: torch.Tensor) -> None:
-        """Update the running value of the statistic."""
+    def _accumulate(self, x: torch.Tensor) -> None:
+        """Merge the values computed by ``_reduce`` into the running value of
+        the statistic."""
         raise NotImplementedError
 
     def update(self, t: torch.Tensor) -> None:
-    
+
         self._check_t(t)
-        self._update(t)
-        
+        self._accumulate(self._reduce(t))
+
+    def accumulate(self, x: torch.Tensor) -> None:
+        """Update the running value of the statistic using values that have
+        already been reduced over each sub-population.
+
+        This method allows ``TensorObserver``s to compute the reductions of
+        several statistics jointly, reading the observed array only once.
+
+        Note that running values are updated in-place, and that the first
+        array passed to a statistic becomes its running value; therefore,
+        ``x`` should not be used by the caller after this call.
+
+        """
+        self._check_n_subpopulations(x.shape[0])
+        self._accumulate(x)
 
 
 class NStatistic(TensorStatistic):
@@ -67,22 +87,20 @@ class NStatistic(TensorStatistic):
 
     def _check_n_overflow(self, n: torch.Tensor):
         """Check that the sample counter is not overflowing!"""
-        if (self._payload.values + n) - self._payload.values != n:
+        if torch.any((self._payload.values + n) - self._payload.values != n):
             raise RuntimeError(quantlib_err_header(obj_name=self.__class__.__name__) + "counter is overflowing!")
 
-    def _update(self, t: torch.Tensor):
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        return torch.full((t.shape[0],), float(t.shape[-1]))
 
-        n = t.shape[-1]
+    def _accumulate(self, n: torch.Tensor):
 
         if not self.is_tracking:
-            n_subpopulations = t.shape[0]
-            n = torch.ones(n_subpopulations) * n
+            n_subpopulations = n.shape[0]
             self._payload = StatisticPayload(n_subpopulations, n)
         else:
-            n = torch.ones(self._payload.n_subpopulations) * n
-            
             self._check_n_overflow(n)
-            self._payload.values = self._payload.values + n
+            self._payload.values.add_(n)
 
 
 class MinStatistic(TensorStatistic):
@@ -90,16 +108,17 @@ class MinStatistic(TensorStatistic):
     def __init__(self):
         super().__init__()
 
-    def _update(self, t: torch.Tensor):
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        return torch.amin(t, dim=-1)
 
-        min_ = torch.amin(t, dim=-1)
+    def _accumulate(self, min_: torch.Tensor):
 
         if not self.is_tracking:
-            n_subpopulations = t.shape[0]
+            n_subpopulations = min_.shape[0]
             self._payload = StatisticPayload(n_subpopulations, min_)
         else:
-            min_ =  min_.to(self._payload.values.device)
-            self._payload.values = torch.min(self._payload.values, min_)
+            min_ = min_.to(self._payload.values.device)
+            torch.minimum(self._payload.values, min_, out=self._payload.values)
 
 
 class MaxStatistic(TensorStatistic):
@@ -107,16 +126,17 @@ class MaxStatistic(TensorStatistic):
     def __init__(self):
         super().__init__()
 
-    def _update(self, t: torch.Tensor):
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        return torch.amax(t, dim=-1)
 
-        max_ = torch.amax(t, dim=-1)
+    def _accumulate(self, max_: torch.Tensor):
 
         if not self.is_tracking:
-            n_subpopulations = t.shape[0]
+            n_subpopulations = max_.shape[0]
             self._payload = StatisticPayload(n_subpopulations, max_)
         else:
-            max_ =  max_.to(self._payload.values.device)
-            self._payload.values = torch.max(self._payload.values, max_)
+            max_ = max_.to(self._payload.values.device)
+            torch.maximum(self._payload.values, max_, out=self._payload.values)
 
 
 class SumStatistic(TensorStatistic):
@@ -124,16 +144,17 @@ class SumStatistic(TensorStatistic):
     def __init__(self):
         super().__init__()
 
-    def _update(self, t: torch.Tensor):
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        return torch.sum(t, dim=-1)
 
-        sum_ = torch.sum(t, dim=-1)
+    def _accumulate(self, sum_: torch.Tensor):
 
         if not self.is_tracking:
-            n_subpopulations = t.shape[0]
+            n_subpopulations = sum_.shape[0]
             self._payload = StatisticPayload(n_subpopulations, sum_)
         else:
-            sum_ =  sum_.to(self._payload.values.device)
-            self._payload.values = self._payload.values + sum_
+            sum_ = sum_.to(self._payload.values.device)
+            self._payload.values.add_(sum_)
 
 
 class Sum2Statistic(TensorStatistic):
@@ -141,13 +162,14 @@ class Sum2Statistic(TensorStatistic):
     def __init__(self):
         super().__init__()
 
-    def _update(self, t: torch.Tensor):
+    def _reduce(self, t: torch.Tensor) -> torch.Tensor:
+        return torch.sum(t.pow(2), dim=-1)
 
-        sum2 = torch.sum(t.pow(2), dim=-1)
+    def _accumulate(self, sum2: torch.Tensor):
 
         if not self.is_tracking:
-            n_subpopulations = t.shape[0]
+            n_subpopulations = sum2.shape[0]
             self._payload = StatisticPayload(n_subpopulations, sum2)
         else:
-            sum2 =  sum2.to(self._payload.values.device)
-            self._payload.values = self._payload.values + sum2
+            sum2 = sum2.to(self._payload.values.device)
+            self._payload.values.add_(sum2)
@@ -68,3 +68,35 @@ class ObserverTest(unittest.TestCase):
         self.assertTrue(observer.max.shape  == observer.broadcasting_shape)
         self.assertTrue(observer.mean.shape == observer.broadcasting_shape)
         self.assertTrue(observer.var.shape  == observer.broadcasting_shape)
+
+    def test_statistics_values(self):
+
+        # the joint reductions should match the reductions computed statistic by statistic
+        qgranularity = resolve_qgranularityspec('per-outchannel_weights')
+        observer = MinMaxMeanVarObserver(subpopulation_dims=qgranularity)
+        ts = [torch.randn(_TARGET_SHAPE) for _ in range(0, _LOOP_LENGTH)]
+        for t in ts:
+            observer.update(t)
+        t = torch.stack(ts, dim=1).reshape(_TARGET_SHAPE[0], -1)
+        self.assertTrue(torch.all(observer.n.flatten() == t.shape[-1]))
+        self.assertTrue(torch.all(observer.min.flatten() == torch.amin(t, dim=-1)))
+        self.assertTrue(torch.all(observer.max.flatten() == torch.amax(t, dim=-1)))
+        self.assertTrue(torch.allclose(observer.mean.flatten(), torch.mean(t, dim=-1), atol=1e-5))
+
+    def test_requires_grad(self):
+
+        # observing arrays that require gradients (e.g., weights during QAT) should not interfere with autograd
+        qgranularity = resolve_qgranularityspec('per-outchannel_weights')
+        observer = MinMaxMeanVarObserver(subpopulation_dims=qgranularity)
+        ts = [torch.randn(_TARGET_SHAPE, requires_grad=True) for _ in range(0, _LOOP_LENGTH)]
+        for t in ts:
+            observer.update(t)
+        t = torch.stack(ts, dim=1).reshape(_TARGET_SHAPE[0], -1).detach()
+        self.assertFalse(observer.min.requires_grad)
+        self.assertFalse(observer.max.requires_grad)
+        self.assertFalse(observer.mean.requires_grad)
+        self.assertFalse(observer.var.requires_grad)
+        self.assertTrue(torch.all(observer.min.flatten() == torch.amin(t, dim=-1)))
+        self.assertTrue(torch.all(observer.max.flatten() == torch.amax(t, dim=-1)))
+        self.assertTrue(torch.allclose(observer.mean.flatten(), torch.mean(t, dim=-1), atol=1e-5))
+        self.assertTrue(all(t_.grad is None for t_ in ts))
@@ -178,13 +178,17 @@ def get_scale(a: torch.Tensor,
     case_iii = case_3_4 | case_3_5 | case_4_3 | case_4_4 | case_4_5 | case_5_3 | case_5_4 | case_5_5
     case_iv  = case_1_4 | case_1_5 | case_2_4 | case_2_5 | case_4_1 | case_4_2 | case_5_1 | case_5_2
 
+    # Masked assignments (`eps[mask] = ...`) need to know how many components
+    # are selected, which forces a device synchronisation for each of them.
+    # Instead, we select the components with `torch.where`; the values that
+    # are not selected (e.g., divisions by zero) are discarded.
     eps = torch.zeros_like(zero)
-    eps[case_i]   = a[case_i] / min_[case_i]
-    eps[case_ii]  = torch.max(a[case_ii] / min_[case_ii], b[case_ii] / max_[case_ii])
-    eps[case_iii] = b[case_iii] / max_[case_iii]
+    eps = torch.where(case_i,   a / min_, eps)
+    eps = torch.where(case_ii,  torch.max(a / min_, b / max_), eps)
+    eps = torch.where(case_iii, b / max_, eps)
     if torch.any(case_iv):
         print(quantlib_wng_header(obj_name=inspect.currentframe().f_code.co_name) + "can not cover some range [a, b] with a scalar multiple of the provided integer range.")
-        eps[case_iv] = torch.max(a[case_iv].abs(), b[case_iv].abs()) / torch.max(min_[case_iv].abs(), max_[case_iv].abs())
+        eps = torch.where(case_iv, torch.max(a.abs(), b.abs()) / torch.max(min_.abs(), max_.abs()), eps)
 
     assert torch.all(eps > 0.0)
 
@@ -32,8 +32,8 @@ class ConstInitStrategy(QHParamsInitStrategy):
         self._b = b
 
     def get_a_b(self, observer: TensorObserver) -> Tuple[torch.Tensor, torch.Tensor]:
-        a = torch.ones(observer.broadcasting_shape) * self._a
-        b = torch.ones(observer.broadcasting_shape) * self._b
+        a = torch.full(observer.broadcasting_shape, float(self._a))
+        b = torch.full(observer.broadcasting_shape, float(self._b))
         return a, b
 
 
@@ -184,24 +184,27 @@ def resolve_tuple_qrangespec(qrangespec: Tuple[int, ...]) -> QRange:
     return QRange(offset, n_levels, step)
 
 
+# the keys supported by dictionary-based specifications
+QRANGE_DICT_N_LEVELS_KEYS = frozenset({'n_levels', 'bitwidth', 'limpbitwidth'})
+QRANGE_DICT_OFFSET_KEYS   = frozenset({'offset', 'signed'})
+QRANGE_DICT_KEYS          = QRANGE_DICT_N_LEVELS_KEYS | QRANGE_DICT_OFFSET_KEYS
+
+
 def resolve_dict_qrangespec(qrangespec: Dict[str, int]) -> QRange:
 
     step = IMPLICIT_STEP
 
-    n_levels_keys = {'n_levels', 'bitwidth', 'limpbitwidth'}
-    offset_keys = {'offset', 'signed'}
-
     # check that the keys conform to the specification
     qrangespec_keys = set(qrangespec.keys())
-    unknown_keys = qrangespec_keys.difference(n_levels_keys | offset_keys)
+    unknown_keys = qrangespec_keys.difference(QRANGE_DICT_KEYS)
     if len(unknown_keys) != 0:
         raise ValueError(quantlib_err_header() + f"QRange dictionary specification does not support the following keys: {unknown_keys}.")
 
     # canonicalise number of levels
-    qrangespec_n_levels_keys = qrangespec_keys.intersection(n_levels_keys)
+    qrangespec_n_levels_keys = qrangespec_keys.intersection(QRANGE_DICT_N_LEVELS_KEYS)
 
     if len(qrangespec_n_levels_keys) == 0:
-        raise ValueError(quantlib_err_header() + f"QRange dictionary specification must specify at least one of the following keys: {n_levels_keys}.")
+        raise ValueError(quantlib_err_header() + f"QRange dictionary specification must specify at least one of the following keys: {set(QRANGE_DICT_N_LEVELS_KEYS)}.")
 
     elif len(qrangespec_n_levels_keys) == 1:
         if qrangespec_n_levels_keys == {'bitwidth'}:
@@ -217,7 +220,7 @@ def resolve_dict_qrangespec(qrangespec: Dict[str, int]) -> QRange:
         raise ValueError(quantlib_err_header() + f"QRange dictionary specification specified the number of levels ambiguously: {qrangespec_n_levels_keys}.")
 
     # canonicalise offset
-    qrangespec_offset_keys = qrangespec_keys.intersection(offset_keys)
+    qrangespec_offset_keys = qrangespec_keys.intersection(QRANGE_DICT_OFFSET_KEYS)
 
     if len(qrangespec_offset_keys) == 0:
         offset = UNKNOWN
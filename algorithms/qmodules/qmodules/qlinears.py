@@ -42,7 +42,7 @@ class QLinear(_QLinear, nn.Linear):
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
 
-        if self._is_quantised:
+        if self._is_quantised_flag:
             weight = self.qweight
         else:
             weight = self.weight
@@ -109,7 +109,7 @@ class QConv1d(_QLinear, nn.Conv1d):
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
 
-        if self._is_quantised:
+        if self._is_quantised_flag:
             weight = self.qweight
         else:
             weight = self.weight
@@ -181,7 +181,7 @@ class QConv2d(_QLinear, nn.Conv2d):
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
 
-        if self._is_quantised:
+        if self._is_quantised_flag:
             weight = self.qweight
         else:
             weight = self.weight
@@ -253,7 +253,7 @@ class QConv3d(_QLinear, nn.Conv3d):
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
 
-        if self._is_quantised:
+        if self._is_quantised_flag:
             weight = self.qweight
         else:
             weight = self.weight
@@ -52,12 +52,29 @@ class _QModule(nn.Module):
 
         self._observer: MinMaxMeanVarObserver = MinMaxMeanVarObserver(self._qgranularity)
         self.register_buffer('_is_observing', torch.tensor(False))
+        self._sync_flags()
 
         self.create_qhparams()
 
         self._qop: Union[torch.autograd.Function, None] = None  # child classes should register an algorithm-specific `torch.autograd.Function`
         self._register_qop()
 
+    def _sync_flags(self):
+        """Mirror the flag buffers into Python ``bool``s.
+
+        The flags are stored as buffers so that they are part of the
+        ``state_dict``, but reading the value of a ``torch.Tensor`` stored on
+        an accelerator requires a device-to-host synchronisation. Since the
+        flags only change at state transitions, we read them there and branch
+        on the Python mirrors in the forward pass.
+        """
+        self._is_quantised_flag: bool = bool(self._is_quantised)
+        self._is_observing_flag: bool = bool(self._is_observing)
+
+    def _load_from_state_dict(self, *args, **kwargs):
+        super(_QModule, self)._load_from_state_dict(*args, **kwargs)
+        self._sync_flags()
+
     def _create_qhparams(self):
         """Create quantiser hyper-parameters.
 
@@ -91,6 +108,7 @@ class _QModule(nn.Module):
             self.zero.data.copy_(zero)
             self.scale.data.copy_(scale)
         self._is_quantised |= True
+        self._sync_flags()
 
     def _create_clipping_bounds(self):
         """Map quantiser hyper-parameters to clipping bounds.
@@ -208,9 +226,11 @@ class _QActivation(_QModule):
     def start_observing(self):
         self._observer = MinMaxMeanVarObserver(self._qgranularity)  # reset observer by creating a new one
         self._is_observing |= True
+        self._sync_flags()
 
     def stop_observing(self):
         self._is_observing &= False
+        self._sync_flags()
         self.init_qhparams()
         self._observer = MinMaxMeanVarObserver(self._qgranularity)  # reset observer by creating a new one
 
@@ -222,11 +242,11 @@ class _QActivation(_QModule):
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
 
-        if self._is_observing:
+        if self._is_observing_flag:
             with torch.no_grad():
                 self._observer.update(x)
 
-        if self._is_quantised:
+        if self._is_quantised_flag:
             x = self._call_qop(x)
         else:
             x = super(_QModule, self).forward(x)
@@ -274,9 +294,11 @@ class _QLinear(_QModule):
 
     def start_observing(self):
         self._is_observing |= True
+        self._sync_flags()
 
     def stop_observing(self):
         self._is_observing &= False
+        self._sync_flags()
         self.init_qhparams()
 
     def _register_qop(self):
@@ -387,3 +387,49 @@ class QModulesTest(unittest.TestCase):
         fqw = muqc2d.qweight
         tqw = fqw / (muqc2d.step * muqc2d.scale)
         self.assertTrue(QModulesTest._check_integerisation(tqw, torch.floor(tqw)))
+
+    def test__qmodule_flags_after_load_state_dict(self):
+
+        qrangespec = {'bitwidth': 8, 'signed': False}
+        qgranularityspec = 'per-array'
+        qhparamsinitstrategyspec = 'const'
+
+        # quantised state
+        # create source object and finalise its quantiser parametrisation
+        src = MockUpQReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        src.init_qhparams()
+        self.assertTrue(QModulesTest._check_is_quantised(src))
+        # load its state into a fresh object: do the Python-side mirrors follow the buffers?
+        dst = MockUpQReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        self.assertFalse(dst._is_quantised_flag)
+        dst.load_state_dict(src.state_dict())
+        self.assertTrue(QModulesTest._check_is_quantised(dst))
+        self.assertTrue(dst._is_quantised_flag)
+        self.assertFalse(dst._is_observing_flag)
+        # does the fresh object take the quantised path?
+        x = torch.randn(_FEATURES_SHAPE)
+        fqy = dst(x)
+        self.assertTrue(torch.all(fqy == src(x)))
+        self.assertFalse(torch.all(fqy == _RELU_MODULE(x)))
+        tqy = fqy / (dst.step * dst.scale)
+        self.assertTrue(QModulesTest._check_integerisation(tqy, torch.floor(tqy)))
+
+        # observing state
+        # create source object and start observing
+        src = MockUpQReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        src.start_observing()
+        # load its state into a fresh object
+        dst = MockUpQReLU.from_fp_module(_RELU_MODULE, qrangespec, qgranularityspec, qhparamsinitstrategyspec)
+        self.assertFalse(dst._is_observing_flag)
+        dst.load_state_dict(src.state_dict())
+        self.assertTrue(dst._is_observing)
+        self.assertTrue(dst._is_observing_flag)
+        self.assertFalse(dst._is_quantised_flag)
+        # does the fresh object feed its observer and finalise its quantiser parametrisation?
+        for i in range(0, _LOOP_LENGTH):
+            x = torch.randn(_FEATURES_SHAPE)
+            _ = dst(x)
+        dst.stop_observing()
+        self.assertFalse(dst._is_observing_flag)
+        self.assertTrue(dst._is_quantised_flag)
+        self.assertTrue(QModulesTest._check_is_quantised(dst))
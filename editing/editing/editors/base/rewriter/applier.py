@@ -1,10 +1,17 @@
 import torch.fx as fx
+from typing import List
 
 from .applicationpoint import ApplicationPoint
 
 
 class Applier(object):
 
+    # `Applier`s whose `_apply` does not depend on the `fx.GraphModule` having
+    # been linted and recompiled after the previous applications can set this
+    # flag; in this case, `apply_all` polishes the `fx.GraphModule` only once,
+    # after all the application points have been rewritten.
+    _polish_once: bool = False
+
     def __init__(self):
         super(Applier, self).__init__()
         self._counter: int = 0  # use `self._counter` to distinguish applications
@@ -16,6 +23,11 @@ class Applier(object):
         # use `id_` to annotate graph modifications
         raise NotImplementedError
 
+    def _next_id(self, id_: str) -> str:
+        """Create a unique application identifier."""
+        self._counter += 1
+        return id_ + f'[{str(self._counter)}]'
+
     @staticmethod
     def _polish_fxgraphmodule(g: fx.GraphModule) -> None:
         """Finalise the modifications made in ``_apply``."""
@@ -27,12 +39,24 @@ class Applier(object):
               ap:  ApplicationPoint,
               id_: str) -> fx.GraphModule:
 
-        # create a unique application identifier
-        self._counter += 1
-        id_ = id_ + f'[{str(self._counter)}]'
-
         # modify the graph
-        g = self._apply(g, ap, id_)
+        g = self._apply(g, ap, self._next_id(id_))
         Applier._polish_fxgraphmodule(g)
 
         return g
+
+    def apply_all(self,
+                  g:   fx.GraphModule,
+                  aps: List[ApplicationPoint],
+                  id_: str) -> fx.GraphModule:
+
+        if not self._polish_once:
+            for ap in aps:
+                g = self.apply(g, ap, id_)
+
+        elif len(aps) > 0:
+            for ap in aps:
+                g = self._apply(g, ap, self._next_id(id_))
+            Applier._polish_fxgraphmodule(g)
+
+        return g
@@ -45,30 +45,37 @@ class Rewriter(BaseEditor):
 
     def find(self, g: fx.GraphModule) -> List[ApplicationPointWithContext]:
         aps = self._finder.find(g)  # find the application points
-        apcontexts = list(map(lambda ap: ApplicationPointWithContext(ap=ap, context=Context(rewriter=self, graph=g)), aps))  # bind each application point to this `Rewriter` and the argument `fx.GraphModule`
+        context = Context(rewriter=self, graph=g)  # all the application points share the same (immutable) context
+        apcontexts = [ApplicationPointWithContext(ap=ap, context=context) for ap in aps]  # bind each application point to this `Rewriter` and the argument `fx.GraphModule`
         return apcontexts
 
     def apply(self, g: fx.GraphModule, apcontexts: Optional[Union[ApplicationPointWithContext, List[ApplicationPointWithContext]]] = None, *args, **kwargs) -> fx.GraphModule:
 
-        # validate application point contexts argument
-        # check type
-        if not ((apcontexts is None) or isinstance(apcontexts, ApplicationPointWithContext) or (isinstance(apcontexts, list) and all(map(lambda apc: isinstance(apc, ApplicationPointWithContext), apcontexts)))):
-            raise TypeError
-        # canonicalise
         if apcontexts is None:
-            apcontexts = self.find(g)
-        elif isinstance(apcontexts, ApplicationPointWithContext):
-            apcontexts = [apcontexts]
-        # verify that the context is correct
-        this_context = Context(rewriter=self, graph=g)
-        if not all(map(lambda apc: apc.context == this_context, apcontexts)):
-            raise ValueError
+            # the application points are found by this `Rewriter` on `g`, so
+            # their context is correct by construction: we can skip binding
+            # and validating it
+            aps = self._finder.find(g)
+
+        else:
+            # validate application point contexts argument
+            # check type
+            if not (isinstance(apcontexts, ApplicationPointWithContext) or (isinstance(apcontexts, list) and all(map(lambda apc: isinstance(apc, ApplicationPointWithContext), apcontexts)))):
+                raise TypeError
+            # canonicalise
+            if isinstance(apcontexts, ApplicationPointWithContext):
+                apcontexts = [apcontexts]
+            # verify that the context is correct
+            this_context = Context(rewriter=self, graph=g)
+            if not all(map(lambda apc: apc.context == this_context, apcontexts)):
+                raise ValueError
+            aps = [apc.ap for apc in apcontexts]
+
         # verify that the application points commute
-        if not self._finder.check_aps_commutativity(list(map(lambda apc: apc.ap, apcontexts))):
+        if not self._finder.check_aps_commutativity(aps):
             raise ValueError
 
         # rewrite all the application points
-        for apc in apcontexts:
-            g = self._applier.apply(g, apc.ap, self.id_)
+        g = self._applier.apply_all(g, aps, self.id_)
 
         return g
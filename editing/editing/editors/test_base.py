@@ -3,7 +3,7 @@ import random
 import torch
 import torch.nn as nn
 import torch.fx as fx
-from typing import List
+from typing import List, NamedTuple
 
 from .base.editor import Editor
 from .base import Annotator
@@ -54,6 +54,33 @@ class MockUpApplier(Applier):
         return g
 
 
+class _MockUpNodeApplicationPoint(NamedTuple):
+    node: fx.Node
+
+
+class MockUpNodeApplicationPoint(ApplicationPoint, _MockUpNodeApplicationPoint):
+    """A class demonstrating how to define an ``ApplicationPoint`` wrapping an
+    ``fx.Node``."""
+    pass
+
+
+class MockUpPolishOnceApplier(Applier):
+    """A class demonstrating how to define an ``Applier`` that lints and
+    recompiles the ``fx.GraphModule`` only once per ``apply_all``."""
+
+    _polish_once = True
+
+    def _apply(self, g: fx.GraphModule, ap: MockUpNodeApplicationPoint, id_: str) -> fx.GraphModule:
+        # double the output of the `fx.Node`
+        n = ap.node
+        users = list(n.users)
+        with g.graph.inserting_after(n):
+            new_node = g.graph.call_function(torch.mul, args=(n, 2.0))
+        for u in users:
+            u.replace_input_with(n, new_node)
+        return g
+
+
 class MockUpRewriter(Rewriter):
     """A class demonstrating how to define a ``Rewriter``."""
 
@@ -205,6 +232,39 @@ class EditorsTest(unittest.TestCase):
         ap = next(iter(aps))
         self.assertRaises(ValueError, lambda: r2.apply(gmnet, ap))
 
+    def test_applier_polish_once(self):
+        """Verify that ``Applier``s with ``_polish_once`` set recompile the
+        ``fx.GraphModule`` exactly once."""
+
+        # create the target `fx.GraphModule`
+        net = MLP()
+        gmnet = qg.fx.quantlib_symbolic_trace(root=net)
+        gmnet.eval()
+        # count the recompilations
+        n_recompilations = [0]
+        recompile = gmnet.recompile
+        def counting_recompile():
+            n_recompilations[0] += 1
+            return recompile()
+        gmnet.recompile = counting_recompile
+        # create the application points
+        aps = [MockUpNodeApplicationPoint(node=n) for n in gmnet.graph.nodes if (n.op == 'call_module') and isinstance(gmnet.get_submodule(n.target), nn.ReLU)]
+        self.assertTrue(len(aps) > 1)
+        # rewrite (all)
+        a = MockUpPolishOnceApplier()
+        gmnet_rewritten = a.apply_all(gmnet, aps, 'MUPolishOnce')
+        self.assertEqual(n_recompilations[0], 1)
+        self.assertEqual(a._counter, len(aps))
+        # is the compiled code up-to-date with all the rewritings?
+        self.assertEqual(gmnet_rewritten.code.count('torch.mul'), len(aps))
+        self.assertEqual(gmnet_rewritten.code, gmnet_rewritten.graph.python_code(root_module='self').src)
+        x = torch.randn(2, 64)
+        self.assertTrue(isinstance(gmnet_rewritten(x), torch.Tensor))
+
+        # no application points, no recompilation
+        gmnet_rewritten = a.apply_all(gmnet_rewritten, [], 'MUPolishOnce')
+        self.assertEqual(n_recompilations[0], 1)
+
     def test_composed_editor(self):
         """Exemplify the usage of ``ComposedEditor``s."""
 
@@ -1,24 +1,52 @@
-import itertools
 import torch.fx as fx
+import torch.nn as nn
+from typing import Dict, List, Optional
 
 from .applicationpoint import EpsTunnelNode
 from quantlib.editing.editing.editors import Applier
+from quantlib.editing.editing.float2fake.quantisation.modulewiseconverter.modulewisedescription import NameToModule
 
 
 class EpsTunnelRemoverApplier(Applier):
 
+    _polish_once = True  # each application only re-wires the neighbours of an `fx.Node`, which is not affected by the other application points
+
+    def __init__(self):
+        super(EpsTunnelRemoverApplier, self).__init__()
+        self._name_to_module: Optional[Dict[str, nn.Module]] = None  # only available while applying a batch of application points
+
+    def _delete_submodule(self, g: fx.GraphModule, target: str) -> None:
+
+        if self._name_to_module is None:
+            g.delete_submodule(target)
+
+        else:  # look up the parent `nn.Module` instead of walking the hierarchy along the qualified name
+            path_to_parent, child = NameToModule.split_path_to_target(target)
+            delattr(self._name_to_module[path_to_parent], child)
+
     def _apply(self, g: fx.GraphModule, ap: EpsTunnelNode, id_: str) -> fx.GraphModule:
 
         node = ap.node
 
         # the `fx.Node` is functionally equivalent to the identity, so we connect its (unique) input to all the outputs
-        predecessors = {p for p in node.all_input_nodes}  # upstream
-        assert len(predecessors) == 1
-        successors = {s for s in node.users}  # downstream
-        for p, s in itertools.product(predecessors, successors):
-            s.replace_input_with(node, p)
+        assert len(node.all_input_nodes) == 1  # stripped when running Python with `-O`
+        predecessor = next(iter(node.all_input_nodes))  # upstream
+        for s in list(node.users):  # downstream (`replace_input_with` modifies `node.users`, so we iterate over a copy)
+            s.replace_input_with(node, predecessor)
 
-        g.delete_submodule(node.target)
+        self._delete_submodule(g, node.target)
         g.graph.erase_node(node)
 
         return g
+
+    def apply_all(self, g: fx.GraphModule, aps: List[EpsTunnelNode], id_: str) -> fx.GraphModule:
+
+        # `EpsTunnel`s have no children, so removing one of them does not
+        # invalidate the map for the parents of the other ones
+        self._name_to_module = dict(g.named_modules())
+        try:
+            g = super(EpsTunnelRemoverApplier, self).apply_all(g, aps, id_)
+        finally:
+            self._name_to_module = None
+
+        return g
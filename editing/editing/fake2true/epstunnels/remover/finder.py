@@ -1,6 +1,6 @@
 import torch
 import torch.fx as fx
-from typing import List
+from typing import List, Union
 
 from .applicationpoint import EpsTunnelNode
 from quantlib.editing.editing.editors import Finder
@@ -8,44 +8,146 @@ from quantlib.editing.graphs.fx import FXOpcodeClasses
 from quantlib.editing.graphs.nn import EpsTunnel
 
 
+# Reading the result of a comparison between arrays stored on an accelerator
+# requires a device-to-host synchronisation. Therefore, when the arrays are not
+# stored on the CPU, we return the result as a zero-dimensional array, and
+# `EpsTunnelRemoverFinder.find` transfers all such results at once.
+LazyCondition = Union[bool, torch.Tensor]
+
+
+def _eps_equal_lazy(a: torch.Tensor, b: torch.Tensor) -> LazyCondition:
+    """Compare two scale arrays, avoiding kernel launches whenever possible."""
+
+    # `EpsTunnel`s are created with the same `torch.Tensor` registered as
+    # both `_eps_in` and `_eps_out`; untouched `EpsTunnel`s can therefore be
+    # detected without comparing their components
+    if a is b:
+        return True
+
+    # metadata mismatches can be detected without reading the arrays
+    if (a.shape != b.shape) or (a.dtype != b.dtype):
+        return False
+
+    if a.device.type != 'cpu':
+        return torch.all(a == b)
+    if a.numel() == 1:
+        return a.item() == b.item()
+    return torch.equal(a, b)
+
+
+def _all_ones_lazy(a: torch.Tensor) -> LazyCondition:
+
+    if a.device.type != 'cpu':
+        return torch.all(a == 1.0)
+    if a.numel() == 1:
+        return a.item() == 1.0
+    return bool(torch.all(a == 1.0))
+
+
+def _lazy_or(c1: LazyCondition, c2: LazyCondition) -> LazyCondition:
+    if isinstance(c1, bool):
+        return c1 or c2
+    elif isinstance(c2, bool):
+        return True if c2 else c1
+    else:
+        return torch.logical_or(c1, c2)
+
+
+def _resolve_lazy(conditions: List[LazyCondition]) -> List[bool]:
+    """Resolve the conditions computed on accelerators with a single
+    device-to-host transfer."""
+
+    pending = [c for c in conditions if isinstance(c, torch.Tensor)]
+    if len(pending) == 0:
+        return conditions
+
+    device = pending[0].device
+    resolved = iter(torch.stack([c.to(device) for c in pending]).tolist())
+    return [next(resolved) if isinstance(c, torch.Tensor) else c for c in conditions]
+
+
 class EpsTunnelRemoverFinder(Finder):
 
     @staticmethod
-    def is_identity_epstunnel(g: fx.GraphModule, n: fx.Node) -> bool:
-        m = g.get_submodule(target=n.target)
-        return torch.all(m.eps_in == m.eps_out)
+    def _is_identity_epstunnel(m: EpsTunnel) -> LazyCondition:
+        return _eps_equal_lazy(m.eps_in, m.eps_out)
 
     @staticmethod
-    def is_integerised_placeholder(g: fx.GraphModule, n: fx.Node) -> bool:
+    def is_identity_epstunnel(m: EpsTunnel) -> bool:
+        return bool(EpsTunnelRemoverFinder._is_identity_epstunnel(m))
+
+    @staticmethod
+    def _is_integerised_placeholder(n: fx.Node, m: EpsTunnel) -> LazyCondition:
 
         # TODO: copy here my handwritten notes (5.5.2022) justifying why this is a valid application point
 
         assert len(n.all_input_nodes) == 1
         predecessor = next(iter(n.all_input_nodes))
 
-        m = g.get_submodule(target=n.target)
+        if predecessor.op not in FXOpcodeClasses.PLACEHOLDER.value:
+            return False
+
+        return _all_ones_lazy(m.eps_out)
+
+    @staticmethod
+    def is_integerised_placeholder(n: fx.Node, m: EpsTunnel) -> bool:
+        return bool(EpsTunnelRemoverFinder._is_integerised_placeholder(n, m))
+
+    @staticmethod
+    def is_not_before_output(n: fx.Node) -> bool:
+        """Return ``False`` if the only user of ``n`` is the graph output.
+
+        ``EpsTunnel``s feeding the output directly must be preserved, since
+        they define the scale of the network's output.
+
+        """
+        # `fx.Node.users` is a `dict`, so `len` is O(1) and we can peek at its
+        # only key without materialising the collection
+        return not ((len(n.users) == 1) and (next(iter(n.users)).op in FXOpcodeClasses.OUTPUT.value))
 
-        return (predecessor.op in FXOpcodeClasses.PLACEHOLDER.value) and torch.all(m.eps_out == 1.0)
-    # if output return False
-    def is_output_node(g , n):
-        users = [u for u in n.users]
-        if len(users)==1:
-            if(users[0].op in FXOpcodeClasses.OUTPUT.value) :
-                return False
-        return True
     def find(self, g: fx.GraphModule) -> List[EpsTunnelNode]:
 
-        # find `EpsTunnel` `fx.Node`s
-        module_nodes = filter(lambda n: (n.op in FXOpcodeClasses.CALL_MODULE.value), g.graph.nodes)
-        # since we consume the `filter` generator twice in the next lines, we must ensure that it does not get empty after the first consumption
-        epstunnels   = list(filter(lambda n: isinstance(g.get_submodule(target=n.target), EpsTunnel), module_nodes))
-
-        # filter out those `fx.Node`s that do not represent the identity or integerised inputs
-        identitytunnels = filter(lambda n: EpsTunnelRemoverFinder.is_identity_epstunnel(g, n), epstunnels)
-        integerisedplhl = filter(lambda n: EpsTunnelRemoverFinder.is_integerised_placeholder(g, n), epstunnels)
-        ls = list(set(list(identitytunnels) + list(integerisedplhl)))
-        not_output_node = filter(lambda n: EpsTunnelRemoverFinder.is_output_node(g, n), ls)
-        return [EpsTunnelNode(n) for n in list(not_output_node)]
+        # We scan the `fx.Node`s once, in topological order, and retrieve the
+        # `nn.Module` of each candidate only once. Since each `fx.Node` is
+        # visited exactly once, the application points are unique.
+        # We resolve the `nn.Module`s from a name-to-module map that we build
+        # once, instead of walking the `nn.Module` hierarchy at each lookup.
+        name_to_module = dict(g.named_modules())
+
+        # if there are no `EpsTunnel`s (e.g., after a previous application of the `EpsTunnelRemover`), we do not need to scan the `fx.Node`s
+        if not any(isinstance(m, EpsTunnel) for m in name_to_module.values()):
+            return []
+
+        # resolve the attributes used in the loop only once
+        call_module_opcodes = FXOpcodeClasses.CALL_MODULE.value
+        epstunnel_type = EpsTunnel
+        is_identity_epstunnel = EpsTunnelRemoverFinder._is_identity_epstunnel
+        is_integerised_placeholder = EpsTunnelRemoverFinder._is_integerised_placeholder
+        is_not_before_output = EpsTunnelRemoverFinder.is_not_before_output
+
+        candidates = []
+        conditions = []
+        for n in g.graph.nodes:
+
+            # find `EpsTunnel` `fx.Node`s
+            if n.op not in call_module_opcodes:
+                continue
+            m = name_to_module[n.target]
+            if not isinstance(m, epstunnel_type):
+                continue
+
+            # keep those `fx.Node`s that represent the identity or integerised inputs
+            if not is_not_before_output(n):
+                continue
+            condition = is_identity_epstunnel(m)
+            if condition is not True:
+                condition = _lazy_or(condition, is_integerised_placeholder(n, m))
+            candidates.append(n)
+            conditions.append(condition)
+
+        aps = [EpsTunnelNode(n) for n, c in zip(candidates, _resolve_lazy(conditions)) if c]
+
+        return aps
 
     def check_aps_commutativity(self, aps: List[EpsTunnelNode]) -> bool:
 
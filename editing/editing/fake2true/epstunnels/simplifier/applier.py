@@ -1,29 +1,22 @@
 import torch
 import torch.fx as fx
 
-
 from .applicationpoint import CandidateEpsTunnelConstruct
 from quantlib.editing.editing.editors import Applier
 
 
 class EpsTunnelConstructApplier(Applier):
 
+    _polish_once = True  # each application only updates the scales of some `EpsTunnel`s, without modifying the graph
+
     def _apply(self, g: fx.GraphModule, ap: CandidateEpsTunnelConstruct, id_: str) -> fx.GraphModule:
-   
+
         # integerise the arrays entering the construct
-        #for node in ap.backward: 
-        #    users = [u for u in node.users] 
-        #    print("Construct simplifier found node " , *users , f" has the node {node} as a predecessor ") 
         inbound_eps_tunnels = tuple(map(lambda n: g.get_submodule(target=n.target), ap.backward))
         for m in inbound_eps_tunnels:
             m.set_eps_out(torch.ones_like(m.eps_out))
 
         # do not integerise the arrays exiting the construct (they are already integerised!)
-        #for node in ap.forward: 
-        #    predecessor = [p for p in node.all_input_nodes]
-        #    users = [u for u in node.users] 
-            
-        #    print(f'For forward {node} has predecessors ', *predecessor  ) 
         outbound_eps_tunnels = tuple(map(lambda n: g.get_submodule(target=n.target), ap.forward))
         for m in outbound_eps_tunnels:
             m.set_eps_in(torch.ones_like(m.eps_in))
@@ -1,6 +1,7 @@
 import torch
+import torch.nn as nn
 import torch.fx as fx
-from typing import Set, List
+from typing import Set, List, Dict, Optional
 
 from .whitelists import whitelist_call_module, whitelist_call_method, whitelist_call_function
 from ..applicationpoint import CandidateEpsTunnelConstruct
@@ -8,9 +9,20 @@ from quantlib.editing.graphs.fx import FXOpcodeClasses
 from quantlib.editing.graphs.nn import EpsTunnel
 
 
+# The traversals resolve the `nn.Module`s of many `call_module` `fx.Node`s
+# (possibly more than once); therefore, they look them up in a name-to-module
+# map that is built once per search, instead of walking the `nn.Module`
+# hierarchy of the `fx.GraphModule` at each lookup.
+NameToModuleType = Dict[str, nn.Module]
+
+
+def _is_epstunnel_node(n: fx.Node, name_to_module: NameToModuleType) -> bool:
+    return (n.op in FXOpcodeClasses.CALL_MODULE.value) and isinstance(name_to_module[n.target], EpsTunnel)
+
+
 # -- TOPOLOGICAL CHECK -- #
 
-def check_node(n: fx.Node, gm: fx.GraphModule) -> bool:
+def check_node(n: fx.Node, name_to_module: NameToModuleType) -> bool:
     """Verify whether an ``fx.Node`` does not modify the scales of its inputs.
 
     This function uses a whitelisting logic: in order to pass the check, the
@@ -32,7 +44,7 @@ def check_node(n: fx.Node, gm: fx.GraphModule) -> bool:
         state = False
 
     elif opcode in FXOpcodeClasses.CALL_MODULE.value:
-        m = gm.get_submodule(target=n.target)
+        m = name_to_module[n.target]
         if isinstance(m, tuple(whitelist_call_module.keys())):
             state = True if all(c(n) for c in whitelist_call_module[type(m)]) else False
         else:
@@ -57,18 +69,18 @@ def check_node(n: fx.Node, gm: fx.GraphModule) -> bool:
     return state
 
 
-def find_backward_frontier(n: fx.Node, gm: fx.GraphModule) -> Set[fx.Node]:
+def find_backward_frontier(n: fx.Node, name_to_module: NameToModuleType) -> Set[fx.Node]:
 
     # impacted `EpsTunnel`s (ancestors)
-    B = set(filter(lambda p: (p.op in FXOpcodeClasses.CALL_MODULE.value) and isinstance(gm.get_submodule(target=p.target), EpsTunnel), n.all_input_nodes))
+    B = set(filter(lambda p: _is_epstunnel_node(p, name_to_module), n.all_input_nodes))
 
     early_exit = False
 
     other_predecessors = set(n.all_input_nodes).difference(B)
     for p_ in other_predecessors:  # scan non-`EpsTunnel` predecessors
 
-        if check_node(p_, gm):
-            P = find_backward_frontier(p_, gm)
+        if check_node(p_, name_to_module):
+            P = find_backward_frontier(p_, name_to_module)
             if len(P) == 0:  # the traversal up this ancestor "leaked"
                 early_exit = True
             else:
@@ -83,18 +95,18 @@ def find_backward_frontier(n: fx.Node, gm: fx.GraphModule) -> Set[fx.Node]:
     return B
 
 
-def find_forward_frontier(n: fx.Node, gm: fx.GraphModule) -> Set[fx.Node]:
+def find_forward_frontier(n: fx.Node, name_to_module: NameToModuleType) -> Set[fx.Node]:
 
     # impacted `EpsTunnel`s (descendants)
-    F = set(filter(lambda s: (s.op in FXOpcodeClasses.CALL_MODULE.value) and isinstance(gm.get_submodule(target=s.target), EpsTunnel), n.users))
+    F = set(filter(lambda s: _is_epstunnel_node(s, name_to_module), n.users))
 
     early_exit = False
 
     other_successors = set(n.users).difference(F)
     for s_ in other_successors:  # scan non-`EpsTunnel` successors
 
-        if check_node(s_, gm):
-            S = find_forward_frontier(s_, gm)
+        if check_node(s_, name_to_module):
+            S = find_forward_frontier(s_, name_to_module)
             if len(S) == 0:  # the traversal down this descendant "leaked"
                 early_exit = True
             else:
@@ -109,7 +121,7 @@ def find_forward_frontier(n: fx.Node, gm: fx.GraphModule) -> Set[fx.Node]:
     return F
 
 
-def find_candidate_construct_from_anchor(anchor: fx.Node, gm: fx.GraphModule) -> CandidateEpsTunnelConstruct:
+def find_candidate_construct_from_anchor(anchor: fx.Node, name_to_module: NameToModuleType) -> CandidateEpsTunnelConstruct:
     """Find a candidate``EpsTunnel`` construct.
 
     Given an ``fx.Node`` representing an ``EpsTunnel``, this function
@@ -152,14 +164,14 @@ def find_candidate_construct_from_anchor(anchor: fx.Node, gm: fx.GraphModule) ->
         B_old, F_old = B, F
 
         # compute ancestor sub-graph (backward pass -- from outbound tentative frontier)
-        B_subsets = list(map(lambda n: find_backward_frontier(n, gm), F_old))
+        B_subsets = list(map(lambda n: find_backward_frontier(n, name_to_module), F_old))
         if any(len(b) == 0 for b in B_subsets):  # a traversal path "leaked" out of the construct
             early_exit = True
         else:
             B = set().union(*B_subsets)
 
         # compute descendant sub-graph (forward pass -- from inbound tentative frontier)
-        F_subsets = list(map(lambda n: find_forward_frontier(n, gm), B))
+        F_subsets = list(map(lambda n: find_forward_frontier(n, name_to_module), B))
         if any(len(f) == 0 for f in F_subsets):  # a traversal path "leaked" out of the construct
             early_exit = True
         else:
@@ -177,17 +189,20 @@ def find_candidate_construct_from_anchor(anchor: fx.Node, gm: fx.GraphModule) ->
     return CandidateEpsTunnelConstruct(backward=B, forward=F)
 
 
-def find_candidate_constructs(gm: fx.GraphModule) -> List[CandidateEpsTunnelConstruct]:
+def find_candidate_constructs(gm: fx.GraphModule, name_to_module: Optional[NameToModuleType] = None) -> List[CandidateEpsTunnelConstruct]:
+
+    if name_to_module is None:
+        name_to_module = dict(gm.named_modules())
 
     constructs = []
 
-    V_eps = list(filter(lambda n: (n.op in FXOpcodeClasses.CALL_MODULE.value) and (isinstance(gm.get_submodule(target=n.target), EpsTunnel)), list(reversed(gm.graph.nodes))))
+    V_eps = [n for n in reversed(gm.graph.nodes) if _is_epstunnel_node(n, name_to_module)]
     V_visited = set()  # we avoid visiting the same `EpsTunnel` twice in its role of outbound frontier member
 
     while len(V_eps) > 0:
 
         anchor = V_eps.pop(0)  # https://docs.python.org/3/tutorial/datastructures.html
-        construct = find_candidate_construct_from_anchor(anchor, gm)
+        construct = find_candidate_construct_from_anchor(anchor, name_to_module)
 
         if construct.is_empty():
             V_visited.add(anchor)
@@ -205,7 +220,7 @@ def find_candidate_constructs(gm: fx.GraphModule) -> List[CandidateEpsTunnelCons
 
 # -- SEMANTIC CHECK -- #
 
-def verify_candidate_construct(cc: CandidateEpsTunnelConstruct, gm: fx.GraphModule) -> bool:
+def verify_candidate_construct(cc: CandidateEpsTunnelConstruct, gm: fx.GraphModule, name_to_module: Optional[NameToModuleType] = None) -> bool:
     """Verify the semantic of a candidate ``EpsTunnel`` construct.
 
     This function checks that a topologically valid ``EpsTunnel`` construct
@@ -213,13 +228,16 @@ def verify_candidate_construct(cc: CandidateEpsTunnelConstruct, gm: fx.GraphModu
 
     """
 
-    input_scales  = tuple(map(lambda n: gm.get_submodule(target=n.target).eps_out, cc.backward))
-    output_scales = tuple(map(lambda n: gm.get_submodule(target=n.target).eps_in,  cc.forward))
+    if name_to_module is None:
+        name_to_module = dict(gm.named_modules())
+
+    input_scales  = tuple(map(lambda n: name_to_module[n.target].eps_out, cc.backward))
+    output_scales = tuple(map(lambda n: name_to_module[n.target].eps_in,  cc.forward))
 
     all_scales = (*input_scales, *output_scales)
 
-    scale_pairs = zip(all_scales[:-1], all_scales[1:])  # since equality is transitive, it suffices to make pair-wise comparison instead of checking the whole Cartesian product
+    scale_pairs = list(zip(all_scales[:-1], all_scales[1:]))  # since equality is transitive, it suffices to make pair-wise comparison instead of checking the whole Cartesian product; we materialise the pairs since we scan them twice
     cond_shape  = all(s1.shape == s2.shape for s1, s2 in scale_pairs)
-    cond_values = all(torch.all(s1 == s2)  for s1, s2 in scale_pairs)
+    cond_values = cond_shape and all(torch.equal(s1, s2) for s1, s2 in scale_pairs)  # `torch.equal` returns a Python `bool` without allocating an intermediate array
 
-    return cond_shape and cond_values
+    return cond_values
@@ -9,8 +9,9 @@ from quantlib.editing.editing.editors import Finder
 class EpsTunnelConstructFinder(Finder):
 
     def find(self, g: fx.GraphModule) -> List[CandidateEpsTunnelConstruct]:
-        candidate_constructs = find_candidate_constructs(g)
-        constructs = list(filter(lambda cc: verify_candidate_construct(cc, g), candidate_constructs))
+        name_to_module = dict(g.named_modules())  # shared by the topological and the semantic checks
+        candidate_constructs = find_candidate_constructs(g, name_to_module)
+        constructs = list(filter(lambda cc: verify_candidate_construct(cc, g, name_to_module), candidate_constructs))
         return constructs
 
     def check_aps_commutativity(self, aps: List[CandidateEpsTunnelConstruct]) -> bool:
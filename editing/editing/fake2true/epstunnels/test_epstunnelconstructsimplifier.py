@@ -0,0 +1,62 @@
+import unittest
+import torch
+import torch.nn as nn
+
+from quantlib.editing.graphs.nn import EpsTunnel
+from quantlib.editing.editing.fake2true.epstunnels.simplifier.finder import EpsTunnelConstructFinder
+from quantlib.editing.editing.fake2true.epstunnels.simplifier.finder.algorithm import find_candidate_constructs, verify_candidate_construct
+import quantlib.editing.graphs as qg
+
+
+_N_FEATURES = 4
+_KERNEL_SIZE = 2
+_EPS       = torch.Tensor([0.5])
+_EPS_OTHER = torch.Tensor([0.25])
+
+
+class EpsMaxPool2dEps(nn.Module):
+    """The smallest candidate ``EpsTunnel`` construct: a scale-preserving
+    operation enclosed by an inbound and an outbound ``EpsTunnel``."""
+
+    def __init__(self, eps_out: torch.Tensor, eps_in: torch.Tensor):
+
+        super(EpsMaxPool2dEps, self).__init__()
+
+        self.eps_inbound  = EpsTunnel(eps=eps_out.clone())  # its `eps_out` is the scale entering the construct
+        self.maxpool2d    = nn.MaxPool2d(kernel_size=_KERNEL_SIZE)
+        self.eps_outbound = EpsTunnel(eps=eps_in.clone())   # its `eps_in` is the scale expected by the construct
+        self.relu         = nn.ReLU()                          # keep `eps_outbound` away from the output
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = self.eps_inbound(x)
+        x = self.maxpool2d(x)
+        x = self.eps_outbound(x)
+        x = self.relu(x)
+        return x
+
+
+class EpsTunnelConstructFinderTest(unittest.TestCase):
+
+    def _check_construct(self, net: EpsMaxPool2dEps, is_valid: bool):
+
+        gmnet = qg.fx.quantlib_symbolic_trace(root=net)
+
+        # the topological check does not depend on the scales
+        candidate_constructs = find_candidate_constructs(gmnet)
+        self.assertEqual(len(candidate_constructs), 1)
+        cc = next(iter(candidate_constructs))
+        self.assertEqual({n.target for n in cc.backward}, {'eps_inbound'})
+        self.assertEqual({n.target for n in cc.forward},  {'eps_outbound'})
+
+        # the semantic check does
+        self.assertEqual(verify_candidate_construct(cc, gmnet), is_valid)
+        self.assertEqual(len(EpsTunnelConstructFinder().find(gmnet)), 1 if is_valid else 0)
+
+    def test_matching_scales(self):
+        self._check_construct(EpsMaxPool2dEps(eps_out=_EPS, eps_in=_EPS), is_valid=True)
+
+    def test_different_scales(self):
+        self._check_construct(EpsMaxPool2dEps(eps_out=_EPS, eps_in=_EPS_OTHER), is_valid=False)
+
+    def test_different_shapes(self):
+        self._check_construct(EpsMaxPool2dEps(eps_out=_EPS, eps_in=_EPS * torch.ones(_N_FEATURES)), is_valid=False)
@@ -0,0 +1,121 @@
+import unittest
+import torch
+import torch.nn as nn
+
+from quantlib.editing.graphs.nn import EpsTunnel
+from quantlib.editing.editing.fake2true.epstunnels.remover.finder import EpsTunnelRemoverFinder
+from quantlib.editing.editing.fake2true.epstunnels.remover.finder import _eps_equal_lazy, _lazy_or, _resolve_lazy
+import quantlib.editing.graphs as qg
+
+
+_N_FEATURES = 4
+_EPS        = torch.Tensor([0.5])
+_EPS_OTHER  = torch.Tensor([0.25])
+_ONES       = torch.Tensor([1.0])
+
+
+class EpsTunnelsNetwork(nn.Module):
+    """A chain of ``EpsTunnel``s covering the cases that the
+    ``EpsTunnelRemoverFinder`` should (and should not) match."""
+
+    def __init__(self):
+
+        super(EpsTunnelsNetwork, self).__init__()
+
+        # integerised placeholder: fake-to-true conversion of the network's input (should match)
+        self.eps_placeholder = EpsTunnel(eps=_EPS.clone())
+        self.eps_placeholder.set_eps_out(_ONES.clone())
+        self.relu1 = nn.ReLU()
+        # untouched `EpsTunnel` (should match)
+        self.eps_identity = EpsTunnel(eps=_EPS.clone())
+        self.relu2 = nn.ReLU()
+        # different scales (should not match)
+        self.eps_different = EpsTunnel(eps=_EPS.clone())
+        self.eps_different.set_eps_out(_EPS_OTHER.clone())
+        self.relu3 = nn.ReLU()
+        # same components, different data types (should not match)
+        self.eps_dtype = EpsTunnel(eps=_EPS.clone())
+        self.eps_dtype.set_eps_out(_EPS.clone().to(dtype=torch.float64))
+        self.relu4 = nn.ReLU()
+        # identity, but feeding the output (should not match)
+        self.eps_output = EpsTunnel(eps=_EPS.clone())
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = self.eps_placeholder(x)
+        x = self.relu1(x)
+        x = self.eps_identity(x)
+        x = self.relu2(x)
+        x = self.eps_different(x)
+        x = self.relu3(x)
+        x = self.eps_dtype(x)
+        x = self.relu4(x)
+        x = self.eps_output(x)
+        return x
+
+
+class EpsTunnelRemoverFinderTest(unittest.TestCase):
+
+    def test_eps_equal_lazy(self):
+
+        # same `torch.Tensor`
+        eps = _EPS.clone()
+        self.assertTrue(_eps_equal_lazy(eps, eps) is True)
+        # same components, different `torch.Tensor`s
+        self.assertTrue(_eps_equal_lazy(_EPS.clone(), _EPS.clone()))
+        self.assertTrue(_eps_equal_lazy(torch.ones(_N_FEATURES), torch.ones(_N_FEATURES)))
+        # different components
+        self.assertFalse(_eps_equal_lazy(_EPS.clone(), _EPS_OTHER.clone()))
+        self.assertFalse(_eps_equal_lazy(torch.ones(_N_FEATURES), torch.arange(0, _N_FEATURES).to(dtype=torch.float32)))
+        # shape mismatch
+        self.assertTrue(_eps_equal_lazy(torch.ones(1), torch.ones(_N_FEATURES)) is False)
+        # data type mismatch
+        self.assertTrue(_eps_equal_lazy(_EPS.clone(), _EPS.clone().to(dtype=torch.float64)) is False)
+
+    def test_lazy_or(self):
+
+        # Python bools
+        self.assertTrue(_lazy_or(True, False) is True)
+        self.assertTrue(_lazy_or(False, True) is True)
+        self.assertTrue(_lazy_or(False, False) is False)
+
+        # zero-dimensional boolean arrays (i.e., the results of comparisons on accelerators)
+        t, f = torch.tensor(True), torch.tensor(False)
+        self.assertTrue(_lazy_or(True, f) is True)
+        self.assertTrue(_lazy_or(f, True) is True)
+        self.assertTrue(_lazy_or(f, False) is f)
+        self.assertTrue(bool(_lazy_or(f, t)))
+        self.assertFalse(bool(_lazy_or(f, f)))
+        self.assertTrue(isinstance(_lazy_or(f, t), torch.Tensor))
+
+        # mixed conditions are resolved in order
+        conditions = [True, _lazy_or(f, t), False, _lazy_or(f, f), _lazy_or(f, False)]
+        self.assertEqual(_resolve_lazy(conditions), [True, True, False, False, False])
+        self.assertEqual(_resolve_lazy([True, False]), [True, False])
+        self.assertEqual(_resolve_lazy([]), [])
+
+    def test_find(self):
+
+        net = EpsTunnelsNetwork()
+        gmnet = qg.fx.quantlib_symbolic_trace(root=net)
+        name_to_module = dict(gmnet.named_modules())
+
+        finder = EpsTunnelRemoverFinder()
+        aps = finder.find(gmnet)
+        self.assertEqual([ap.node.target for ap in aps], ['eps_placeholder', 'eps_identity'])
+        self.assertTrue(finder.check_aps_commutativity(aps))
+
+        # check the predicates individually
+        nodes = {n.target: n for n in gmnet.graph.nodes if n.op == 'call_module'}
+        self.assertFalse(EpsTunnelRemoverFinder.is_identity_epstunnel(name_to_module['eps_placeholder']))
+        self.assertTrue(EpsTunnelRemoverFinder.is_integerised_placeholder(nodes['eps_placeholder'], name_to_module['eps_placeholder']))
+        self.assertTrue(EpsTunnelRemoverFinder.is_identity_epstunnel(name_to_module['eps_identity']))
+        self.assertFalse(EpsTunnelRemoverFinder.is_integerised_placeholder(nodes['eps_identity'], name_to_module['eps_identity']))
+        self.assertFalse(EpsTunnelRemoverFinder.is_identity_epstunnel(name_to_module['eps_different']))
+        self.assertFalse(EpsTunnelRemoverFinder.is_identity_epstunnel(name_to_module['eps_dtype']))
+        self.assertTrue(EpsTunnelRemoverFinder.is_identity_epstunnel(name_to_module['eps_output']))
+        self.assertFalse(EpsTunnelRemoverFinder.is_not_before_output(nodes['eps_output']))
+        self.assertTrue(EpsTunnelRemoverFinder.is_not_before_output(nodes['eps_identity']))
+
+        # no `EpsTunnel`s, no application points
+        gmnet = qg.fx.quantlib_symbolic_trace(root=nn.Sequential(nn.ReLU()))
+        self.assertEqual(finder.find(gmnet), [])
@@ -1,4 +1,6 @@
-from functools import partial
+import torch.fx as fx
+import torch.nn as nn
+from typing import Union, Callable, Optional, Dict, Any
 
 from quantlib.editing.graphs.fx import QuantLibTracer, custom_symbolic_trace
 from quantlib.editing.graphs.nn import HarmonisedAdd
@@ -10,4 +12,7 @@ class QuantLibHarmonisedAddTracer(QuantLibTracer):
         super(QuantLibHarmonisedAddTracer, self).__init__(other_leaf_types)
 
 
-quantlib_harmonisedadd_symbolic_trace = partial(custom_symbolic_trace, tracer=QuantLibHarmonisedAddTracer())
+def quantlib_harmonisedadd_symbolic_trace(root: Union[Callable, nn.Module],
+                                          concrete_args: Optional[Dict[str, Any]] = None) -> fx.GraphModule:
+    # see `quantlib_symbolic_trace`
+    return custom_symbolic_trace(QuantLibHarmonisedAddTracer(), root, concrete_args)
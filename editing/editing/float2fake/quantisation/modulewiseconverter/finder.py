@@ -6,6 +6,7 @@ from .modulewisedescription import ModuleWiseDescription
 from .modulewisedescription import NameToModule
 from .applicationpoint import NodeWithPartition
 from quantlib.editing.editing.editors import Finder
+from quantlib.editing.graphs.fx import FXOpcodeClasses
 
 
 class ModuleWiseFinder(Finder):
@@ -29,7 +30,8 @@ class ModuleWiseFinder(Finder):
 
         # prepare the data structure on which we support the search
         name_to_module = NameToModule(g.named_modules())
-        name_to_node = OrderedDict([(n.target, n) for n in g.graph.nodes if n.target in name_to_module.keys()])  # to pull-back matches from `(str, nn.Module)` objects to `fx.Node`s
+        call_module_opcodes = FXOpcodeClasses.CALL_MODULE.value  # only `call_module` `fx.Node`s can represent `nn.Module`s, so we skip the other opcodes before looking up their targets
+        name_to_node = OrderedDict([(n.target, n) for n in g.graph.nodes if (n.op in call_module_opcodes) and (n.target in name_to_module)])  # to pull-back matches from `(str, nn.Module)` objects to `fx.Node`s
 
         # loop over partitions
         for id_, (n2mfilter, _) in self.modulewisedescription.items():
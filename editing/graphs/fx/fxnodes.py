@@ -47,12 +47,14 @@ from typing import Tuple, Dict, NamedTuple, Union, Any
 #               ALL_                 #
 
 # singleton opcode classes
-FXOPCODE_PLACEHOLDER   = {'placeholder'}
-FXOPCODE_OUTPUT        = {'output'}
-FXOPCODE_GET_ATTR      = {'get_attr'}
-FXOPCODE_CALL_MODULE   = {'call_module'}
-FXOPCODE_CALL_FUNCTION = {'call_function'}
-FXOPCODE_CALL_METHOD   = {'call_method'}
+# (these are `frozenset`s: membership tests are O(1), and since they are shared
+# by all the editors through `FXOpcodeClasses`, no client can modify them)
+FXOPCODE_PLACEHOLDER   = frozenset({'placeholder'})
+FXOPCODE_OUTPUT        = frozenset({'output'})
+FXOPCODE_GET_ATTR      = frozenset({'get_attr'})
+FXOPCODE_CALL_MODULE   = frozenset({'call_module'})
+FXOPCODE_CALL_FUNCTION = frozenset({'call_function'})
+FXOPCODE_CALL_METHOD   = frozenset({'call_method'})
 
 # higher-level opcode classes
 FXOPCODES_IO              = FXOPCODE_PLACEHOLDER   | FXOPCODE_OUTPUT
@@ -1,4 +1,3 @@
-from functools import partial
 import torch.nn as nn
 import torch.fx as fx
 from typing import Tuple, Dict, Any, Union, Optional, Callable, Type
@@ -30,13 +29,17 @@ class CustomTracer(fx.Tracer):
     
     def is_leaf_module(self, m: nn.Module, module_qualified_name: str) -> bool:
         """Extend the base class check to custom ``nn.Module``s."""
-        fxtracer_cond = super().is_leaf_module(m, module_qualified_name)
-        custom_cond   = isinstance(m, self._leaf_types)
-        return fxtracer_cond or custom_cond
+        # the custom check is cheaper than the base class one, so we evaluate it first
+        return isinstance(m, self._leaf_types) or super().is_leaf_module(m, module_qualified_name)
 
 
 class QuantLibTracer(CustomTracer):
 
+    # the QuantLib `nn.Module`s do not change between `QuantLibTracer`s, so we define them once
+    _QUANTLIB_LEAF_TYPES: Tuple[Type[nn.Module], ...] = (_QModule, EpsTunnel, Requantisation, AnalogAccumulator, AnalogGaussianNoise)
+    # `QuantLibTracer`s created with the same additional leaf types share the same tuple of leaf types
+    _LEAF_TYPES_CACHE: Dict[Tuple[Type[nn.Module], ...], Tuple[Type[nn.Module], ...]] = {}
+
     def __init__(self, other_leaf_types: Tuple[Type[nn.Module], ...] = tuple(), *args, **kwargs):
         """An ``fx.Tracer`` treating QuantLib ``nn.Module``s as leaves.
 
@@ -45,8 +48,11 @@ class QuantLibTracer(CustomTracer):
         for instance, when creating containers of ``_QModule``s.
 
         """
-        quantlib_leaf_types = (_QModule, EpsTunnel, Requantisation,AnalogAccumulator,AnalogGaussianNoise)
-        leaf_types = (*quantlib_leaf_types, *other_leaf_types)
+        other_leaf_types = tuple(other_leaf_types)
+        try:
+            leaf_types = QuantLibTracer._LEAF_TYPES_CACHE[other_leaf_types]
+        except KeyError:
+            leaf_types = QuantLibTracer._LEAF_TYPES_CACHE.setdefault(other_leaf_types, (*QuantLibTracer._QUANTLIB_LEAF_TYPES, *other_leaf_types))
         super().__init__(leaf_types=leaf_types, *args, **kwargs)
 
 
@@ -56,7 +62,15 @@ SymbolicTraceFnType = Callable[[fx.Tracer, Union[Callable, nn.Module], Optional[
 def custom_symbolic_trace(tracer: CustomTracer,
                           root: Union[Callable, nn.Module],
                           concrete_args: Optional[Dict[str, Any]] = None) -> fx.GraphModule:
+    """Trace ``root`` with the given ``tracer``.
+
+    Note that the result of a trace is not cached: the ``fx.GraphModule``s
+    returned by this function are edited in-place by QuantLib's ``Editor``s,
+    and ``Retracer``s rely on re-tracing the edited ``fx.GraphModule`` (whose
+    class does not change) to canonicalise it. Therefore, neither the class
+    of ``root`` nor its identity are valid cache keys.
 
+    """
     graph = tracer.trace(root, concrete_args)
     name  = root.__class__.__name__ if isinstance(root, nn.Module) else root.__name__
     gm    = fx.GraphModule(tracer.root, graph, name)
@@ -64,4 +78,8 @@ def custom_symbolic_trace(tracer: CustomTracer,
     return gm
 
 
-quantlib_symbolic_trace = partial(custom_symbolic_trace, tracer=QuantLibTracer())
+def quantlib_symbolic_trace(root: Union[Callable, nn.Module],
+                            concrete_args: Optional[Dict[str, Any]] = None) -> fx.GraphModule:
+    # `fx.Tracer`s store the state of the last trace (e.g., the traced root),
+    # so we use a new `QuantLibTracer` for each trace instead of sharing one
+    return custom_symbolic_trace(QuantLibTracer(), root, concrete_args)